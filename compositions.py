@@ -0,0 +1,108 @@
+import math
+from typing import Iterator
+
+from ksubsets import k_subset_lex_rank, k_subset_lex_successor, k_subset_lex_unrank
+
+__author__ = "Bram Devlaminck"
+
+# A composition of m in n parts is a sequence of n positive integers a_1, ..., a_n with sum m.
+# The partial sums a_1, a_1 + a_2, ..., a_1 + ... + a_{n-1} form an (n - 1)-subset of {1, ..., m - 1} and every
+# such subset corresponds with exactly one composition.
+# Comparing two compositions lexicographically gives the same result as comparing their partial sums,
+# so the lexicographic rank of a composition is the lexicographic rank of its subset.
+
+
+def enum_compositions(m: int, n: int) -> int:
+    """Number of compositions of m in n parts"""
+    if n == 0:
+        return 1 if m == 0 else 0
+    if m < n:
+        return 0
+    return math.comb(m - 1, n - 1)
+
+
+def composition_to_k_subset(composition: list[int]) -> list[int]:
+    """Convert a composition in n parts to the (n - 1)-subset of its partial sums"""
+    subset = []
+    partial_sum = 0
+    for part in composition[:-1]:
+        partial_sum += part
+        subset.append(partial_sum)
+    return subset
+
+
+def k_subset_to_composition(subset: list[int], m: int) -> list[int]:
+    """Convert an (n - 1)-subset of {1, ..., m - 1} back to the composition of m in n parts"""
+    return [b - a for a, b in zip([0] + subset, subset + [m])]
+
+
+def composition_lex_successor(m: int, composition: list[int]) -> list[int] | None:
+    """Return the lexicographic successor if it exists, otherwise return None"""
+    successor = k_subset_lex_successor(composition_to_k_subset(composition), m - 1)
+    if successor is None:
+        return None
+    return k_subset_to_composition(successor, m)
+
+
+def composition_lex_rank(m: int, composition: list[int]) -> int:
+    """Lexicographic rank of a composition of m, equal to the k_subset_lex_rank of its partial sums"""
+    return k_subset_lex_rank(composition_to_k_subset(composition), m - 1)
+
+
+def composition_lex_unrank(m: int, n: int, rank: int) -> list[int]:
+    """Inverse of composition_lex_rank"""
+    # the empty composition is the only composition in 0 parts (and only of m = 0)
+    if n == 0:
+        return []
+    return k_subset_to_composition(k_subset_lex_unrank(rank, n - 1, m - 1), m)
+
+
+def generate_compositions(m: int, n: int) -> Iterator[list[int]]:
+    """
+    Generate all the compositions of m in n parts in lexicographic order (constant amortized time per step)
+
+    The successor is calculated in place: search the last part a_i (i < n) that can be increased,
+    which is the case as long as the parts after it do not all equal 1.
+    Then a_i increases by 1, the parts a_{i+1}, ..., a_{n-1} become 1 and the last part gets what is left of m.
+    """
+    if n == 0:
+        if m == 0:
+            yield []
+        return
+    if m < n:
+        return
+
+    composition = [1 for _ in range(n)]
+    composition[-1] = m - n + 1
+    while True:
+        yield composition[::]
+        # the last part must be bigger than 1 so we can move 1 from it to the part before it
+        # if the last part is 1, collect all the trailing 1's until we find a part that can give up its surplus
+        i = n - 1
+        surplus = composition[i] - 1
+        while i >= 1 and surplus == 0:
+            i -= 1
+            surplus = composition[i] - 1
+        if i < 1:
+            return
+        # a_{i-1} increases by 1, a_i, ..., a_{n-2} become 1 and a_{n-1} gets the rest of the surplus
+        # (the parts between i and n - 1 are already 1)
+        composition[i - 1] += 1
+        composition[i] = 1
+        composition[-1] = surplus
+
+
+if __name__ == "__main__":
+    print(enum_compositions(6, 3))
+    print("----")
+    print(composition_to_k_subset([2, 1, 3]))
+    print("----")
+    print(k_subset_to_composition([2, 3], 6))
+    print("----")
+    print(composition_lex_successor(6, [2, 1, 3]))
+    print("----")
+    print(composition_lex_rank(6, [2, 1, 3]))
+    print("----")
+    print(composition_lex_unrank(6, 3, 5))
+    print("----")
+    print(list(generate_compositions(6, 3)))
@@ -76,6 +76,10 @@ def k_subset_colex_successor(given_set: list[int], n: int) -> list[int] | None:
     k = len(given_set)
     work_set = given_set[::]
 
+    # the empty set is the only 0-subset => no successor exists
+    if k == 0:
+        return None
+
     # search the first index from the back that does not have its max allowed value
     # otherwise said: an index does not have its maximum value if the following holds:
     # When we increase the value on index i by 1, it is still smaller than the value on index i - 1
@@ -103,7 +107,6 @@ def k_subset_colex_rank(given_set: list[int]) -> int:
     reward = 0
     for i in range(1, k + 1):
         reward += math.comb(given_set[i - 1] - 1, k + 1 - i)
-        print(math.comb(given_set[i - 1] - 1, k + 1 - i))
     return reward
 
 
@@ -147,6 +150,10 @@ def k_subset_rev_door_unrank(rank: int, k: int, n: int) -> list[int]:
 def k_subset_rev_door_successor(given_set: list[int], n: int) -> list[int]:
     """Algorithm 2.13"""
     k = len(given_set)
+    # the order is cyclic, if k == n there is only one subset, so it is its own successor
+    if k == n:
+        return given_set[::]
+
     work_set = given_set[::]
     work_set.append(n + 1)
 
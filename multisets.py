@@ -0,0 +1,229 @@
+import math
+from collections import Counter
+from typing import Iterable, Iterator
+
+from ksubsets import k_subset_lex_rank, k_subset_lex_unrank
+
+__author__ = "Bram Devlaminck"
+
+
+def multinomial(counts: Iterable[int]) -> int:
+    """
+    Number of distinct permutations of a multiset with the given multiplicities
+
+    multinomial(c_1, ..., c_k) = comb(c_1, c_1) * comb(c_1 + c_2, c_2) * ... * comb(c_1 + ... + c_k, c_k)
+    """
+    total = 1
+    size = 0
+    for count in counts:
+        size += count
+        total *= math.comb(size, count)
+    return total
+
+
+def _values_and_counts(multiset: list[int]) -> tuple[list[int], list[int]]:
+    """Split a multiset in its sorted distinct values and their multiplicities"""
+    counter = Counter(multiset)
+    values = sorted(counter)
+    return values, [counter[value] for value in values]
+
+
+def multiset_perm_lex_successor(input_permutation: list[int]) -> list[int] | None:
+    """
+    Algorithm 2.14, adapted to allow repeated values
+
+    Return the successor if it exists, otherwise return None
+    """
+    n = len(input_permutation)
+    # find i such that perm[i] < perm[i+1] >= perm[i + 2] >= ... >= perm[n - 1]
+    # (>= instead of > since equal values can follow each other now)
+    i = n - 2
+    while i >= 0 and input_permutation[i] >= input_permutation[i + 1]:
+        i -= 1
+    if i < 0:
+        return None
+
+    # find the last j such that perm[j] > perm[i]
+    j = n - 1
+    while input_permutation[j] <= input_permutation[i]:
+        j -= 1
+
+    permutation = input_permutation[::]
+    permutation[i], permutation[j] = permutation[j], permutation[i]
+
+    # reverse the (non-increasing) tail to make it the smallest possible tail
+    return permutation[:i + 1] + permutation[i + 1:][::-1]
+
+
+def multiset_perm_lex_rank(permutation: list[int]) -> int:
+    """
+    Algorithm 2.15, adapted to allow repeated values
+
+    Instead of (n - j)! we count the permutations of the remaining multiset that start with a smaller value.
+    If there are `total` permutations of the remaining multiset, exactly total * c_v / remaining of them
+    start with value v (c_v being the number of times v is still left), so no factorials have to be recomputed.
+    """
+    values, counts = _values_and_counts(permutation)
+    index_of = {value: index for index, value in enumerate(values)}
+
+    remaining = len(permutation)
+    total = multinomial(counts)
+    rank = 0
+    for value in permutation:
+        index = index_of[value]
+        # all the permutations starting with a smaller value have a smaller rank
+        for smaller in range(index):
+            rank += total * counts[smaller] // remaining
+        # continue with the permutations of the multiset where this value is removed once
+        total = total * counts[index] // remaining
+        counts[index] -= 1
+        remaining -= 1
+
+    return rank
+
+
+def multiset_perm_lex_unrank(multiset: list[int], rank: int) -> list[int]:
+    """Algorithm 2.16, adapted to allow repeated values (inverse of multiset_perm_lex_rank)"""
+    values, counts = _values_and_counts(multiset)
+
+    remaining = len(multiset)
+    total = multinomial(counts)
+    permutation = []
+    for _ in range(len(multiset)):
+        # search the value that has enough permutations starting with it to reach the required rank
+        for index, value in enumerate(values):
+            if counts[index] == 0:
+                continue
+            number_of_permutations = total * counts[index] // remaining
+            if rank < number_of_permutations:
+                permutation.append(value)
+                total = number_of_permutations
+                counts[index] -= 1
+                remaining -= 1
+                break
+            rank -= number_of_permutations
+
+    return permutation
+
+
+def generate_multiset_permutations(multiset: list[int]) -> Iterator[list[int]]:
+    """
+    Loopless generation of multiset permutations by prefix shifts (cool-lex order)
+    See: Aaron Williams, "Loopless Generation of Multiset Permutations using a Constant Number of Variables
+    by Prefix Shifts" (2009)
+
+    The permutation is stored as a linked list (value and next arrays) so every prefix shift is O(1),
+    only copying the permutation for the caller takes O(n).
+    """
+    n = len(multiset)
+    if n < 2:
+        yield multiset[::]
+        return
+
+    # linked list containing the values in non-increasing order, index 0 is the head
+    value = sorted(multiset, reverse=True)
+    next_node = [k + 1 for k in range(n)]
+    next_node[-1] = -1
+
+    def visit(head: int) -> list[int]:
+        """Convert the linked list starting at head to a list"""
+        result = []
+        while head != -1:
+            result.append(value[head])
+            head = next_node[head]
+        return result
+
+    head, i, j = 0, n - 2, n - 1
+    yield visit(head)
+    while next_node[j] != -1 or value[j] < value[head]:
+        if next_node[j] != -1 and value[i] >= value[next_node[j]]:
+            s = j
+        else:
+            s = i
+        # shift the node after s to the front of the list
+        t = next_node[s]
+        next_node[s] = next_node[t]
+        next_node[t] = head
+        if value[t] < value[head]:
+            i = t
+        j = next_node[i]
+        head = t
+        yield visit(head)
+
+
+def k_multisubset_lex_successor(given_multisubset: list[int], n: int) -> list[int] | None:
+    """
+    Algorithm 2.6, adapted to multisubsets (t_1 <= t_2 <= ... <= t_k, values from 1 up to n)
+
+    Return the successor if it exists, otherwise None
+    """
+    k = len(given_multisubset)
+    # every index can contain n, so search the last index that does not contain n yet
+    i = k - 1
+    while i >= 0 and given_multisubset[i] == n:
+        i -= 1
+
+    if i < 0:
+        return None
+
+    # increase this value and give all the values after it the smallest allowed value (which is that same value)
+    work_set = given_multisubset[::]
+    work_set[i] += 1
+    for j in range(i + 1, k):
+        work_set[j] = work_set[i]
+
+    return work_set
+
+
+def k_multisubset_lex_rank(given_multisubset: list[int], n: int) -> int:
+    """
+    Lexicographic rank of a k-multisubset of {1, ..., n}
+
+    t_1 <= t_2 <= ... <= t_k corresponds with the k-subset t_1 < t_2 + 1 < ... < t_k + k - 1 of {1, ..., n + k - 1}
+    and this bijection preserves the lexicographic order
+    """
+    k = len(given_multisubset)
+    return k_subset_lex_rank([t + i for i, t in enumerate(given_multisubset)], n + k - 1)
+
+
+def k_multisubset_lex_unrank(rank: int, k: int, n: int) -> list[int]:
+    """Inverse of k_multisubset_lex_rank"""
+    return [t - i for i, t in enumerate(k_subset_lex_unrank(rank, k, n + k - 1))]
+
+
+def generate_k_multisubsets(k: int, n: int) -> Iterator[list[int]]:
+    """Generate all the k-multisubsets of {1, ..., n} in lexicographic order (constant amortized time per step)"""
+    if n < 1 and k > 0:
+        return
+
+    multisubset = [1 for _ in range(k)]
+    while True:
+        yield multisubset[::]
+        i = k - 1
+        while i >= 0 and multisubset[i] == n:
+            i -= 1
+        if i < 0:
+            return
+        multisubset[i] += 1
+        for j in range(i + 1, k):
+            multisubset[j] = multisubset[i]
+
+
+if __name__ == "__main__":
+    print(multinomial((2, 1, 1)))
+    print("-----------")
+    print(multiset_perm_lex_successor([1, 2, 2, 1]))
+    print("-----------")
+    print(multiset_perm_lex_rank([2, 1, 3, 1]))
+    print("-----------")
+    print(multiset_perm_lex_unrank([1, 1, 2, 3], 7))
+    print("-----------")
+    print(list(generate_multiset_permutations([1, 1, 2, 3])))
+    print("-----------")
+    print(k_multisubset_lex_successor([1, 3, 3], 3))
+    print("-----------")
+    print(k_multisubset_lex_rank([1, 3, 3], 3))
+    print("-----------")
+    print(k_multisubset_lex_unrank(5, 3, 3))
+    print("-----------")
+    print(list(generate_k_multisubsets(2, 3)))
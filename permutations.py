@@ -96,9 +96,11 @@ def trotter_johnson_unrank(n: int, rank: int) -> list[int]:
     # the base permutation is just the value 1, we will add to this to create the final permutation
     permutation = [1]
     r2 = 0
+    n_faculty = math.factorial(n)
 
     for j in range(2, n + 1):
-        r1 = math.floor(rank * math.factorial(j) / math.factorial(n))
+        # use integer division, float division loses precision once n! no longer fits in a float mantissa (n > 18)
+        r1 = rank * math.factorial(j) // n_faculty
         k = (r1 - j * r2)
         # calculate until where we have to loop
         end_index = j - k - 2 if r2 % 2 == 0 else k - 1
@@ -0,0 +1,208 @@
+from typing import Iterator
+
+__author__ = "Bram Devlaminck"
+
+
+def enum_set_partitions(m: int, n: int) -> list[list[int]]:
+    """
+    Stirling numbers of the second kind, same table layout as enum_partitions
+
+    matrix[i][j] is the number of partitions of a set of size i in exactly j blocks:
+    S(i, j) = j * S(i - 1, j) + S(i - 1, j - 1)
+    (element i is either added to one of the j existing blocks, or is placed in a new block on its own)
+    """
+    matrix = [[0 for _ in range(n + 1)] for _ in range(m + 1)]
+    matrix[0][0] = 1
+
+    for i in range(1, m + 1):
+        for j in range(1, min(i, n) + 1):
+            matrix[i][j] = j * matrix[i - 1][j] + matrix[i - 1][j - 1]
+    return matrix
+
+
+def enum_bell_numbers(m: int) -> list[int]:
+    """Bell numbers B(0), ..., B(m): the sum of the rows of the Stirling table"""
+    return [sum(row) for row in enum_set_partitions(m, m)]
+
+
+def enum_rgf_tails(m: int) -> list[list[int]]:
+    """
+    matrix[i][t] is the number of ways to complete a restricted growth function when there are still i
+    positions left to fill and the maximum value used so far is t:
+    d(0, t) = 1 and d(i, t) = t * d(i - 1, t) + d(i - 1, t + 1)
+    (the next value is either one of the t values already used, or the new value t + 1)
+    """
+    matrix = [[0 for _ in range(m + 2)] for _ in range(m + 1)]
+    for t in range(m + 2):
+        matrix[0][t] = 1
+
+    for i in range(1, m + 1):
+        for t in range(m + 1 - i, 0, -1):
+            matrix[i][t] = t * matrix[i - 1][t] + matrix[i - 1][t + 1]
+    return matrix
+
+
+def set_partition_to_rgf(partition: list[set[int]], m: int) -> list[int]:
+    """
+    Convert a partition of {1, ..., m} to its restricted growth function:
+    f[i] is the number of the block that contains i + 1, where the blocks are numbered in order of their smallest element
+    """
+    f = [0 for _ in range(m)]
+    block_number = 0
+    # sort the blocks on their minimum element to make sure they get their numbers in the correct order
+    for block in sorted(partition, key=min):
+        block_number += 1
+        for element in block:
+            f[element - 1] = block_number
+    return f
+
+
+def rgf_to_set_partition(f: list[int]) -> list[set[int]]:
+    """Convert a restricted growth function to the partition of {1, ..., m} it represents"""
+    partition = [set() for _ in range(max(f, default=0))]
+    for i, block_number in enumerate(f):
+        partition[block_number - 1].add(i + 1)
+    return partition
+
+
+def rgf_lex_successor(f: list[int]) -> list[int] | None:
+    """
+    Return the lexicographic successor of the restricted growth function if it exists, otherwise return None
+    """
+    m = len(f)
+    prefix_max = [0 for _ in range(m)]
+    for i in range(1, m):
+        prefix_max[i] = max(prefix_max[i - 1], f[i - 1])
+
+    # search the last index that can still be increased (f[i] can be at most 1 more than all the values before it)
+    i = m - 1
+    while i >= 1 and f[i] > prefix_max[i]:
+        i -= 1
+
+    if i < 1:
+        return None
+
+    # increase this value and set all the values after it to their minimum value 1
+    result = f[::]
+    result[i] += 1
+    for j in range(i + 1, m):
+        result[j] = 1
+    return result
+
+
+def rgf_lex_rank(f: list[int]) -> int:
+    """Lexicographic rank of a restricted growth function"""
+    m = len(f)
+    d = enum_rgf_tails(m)
+    rank = 0
+    t = 1  # f[0] is always 1
+    for i in range(1, m):
+        # all the functions with a smaller value on index i have a smaller rank
+        # for each of these values, there are d(m - i - 1, t) ways to complete the function
+        # (the only value that could increase the maximum is t + 1, which is never smaller than f[i])
+        rank += (f[i] - 1) * d[m - i - 1][t]
+        t = max(t, f[i])
+    return rank
+
+
+def rgf_lex_unrank(m: int, rank: int) -> list[int]:
+    """Inverse of rgf_lex_rank"""
+    if m == 0:
+        return []
+
+    d = enum_rgf_tails(m)
+    f = [1 for _ in range(m)]
+    t = 1
+    for i in range(1, m):
+        number_of_completions = d[m - i - 1][t]
+        if rank >= t * number_of_completions:
+            # all the values 1, ..., t are not enough to reach the rank => we need to use the new value t + 1
+            rank -= t * number_of_completions
+            t += 1
+            f[i] = t
+        else:
+            f[i] = rank // number_of_completions + 1
+            rank %= number_of_completions
+    return f
+
+
+def generate_rgf_lex(m: int) -> Iterator[list[int]]:
+    """Generate all the restricted growth functions of length m in lexicographic order (constant amortized time)"""
+    f = [1 for _ in range(m)]
+    # prefix_max[i] is the maximum of f[0], ..., f[i - 1]
+    prefix_max = [1 for _ in range(m)]
+    if m > 0:
+        prefix_max[0] = 0
+
+    while True:
+        yield f[::]
+        i = m - 1
+        while i >= 1 and f[i] > prefix_max[i]:
+            i -= 1
+        if i < 1:
+            return
+        f[i] += 1
+        # all the values after i become 1 again, so they all have the same prefix maximum
+        new_max = max(prefix_max[i], f[i])
+        for j in range(i + 1, m):
+            f[j] = 1
+            prefix_max[j] = new_max
+
+
+def generate_rgf_gray(m: int) -> Iterator[list[int]]:
+    """
+    Generate all the restricted growth functions of length m in a Gray code order:
+    every function differs from the previous one in exactly one position
+
+    If M is the maximum of f[0], ..., f[i - 1] plus 1, then f[i] runs through 1, M, M - 1, ..., 2
+    when moving forward and through 2, ..., M, 1 when moving backward.
+    Both runs start and end with a value (1 or 2) that is allowed for every prefix, so when f[i] reaches the end of
+    its run we can change a value before it and just reverse the direction of f[i] (like the binary reflected Gray code).
+    Each position runs through at least 2 values, which makes the search for the index to change constant amortized.
+    """
+    f = [1 for _ in range(m)]
+    forward = [True for _ in range(m)]
+    # prefix_max[i] is the maximum of f[0], ..., f[i - 1]
+    prefix_max = [1 for _ in range(m)]
+    if m > 0:
+        prefix_max[0] = 0
+
+    while True:
+        yield f[::]
+        # search the last index that is not yet at the end of its run, reversing the direction of the others
+        i = m - 1
+        while i >= 1 and f[i] == (2 if forward[i] else 1):
+            forward[i] = not forward[i]
+            i -= 1
+        if i < 1:
+            return
+
+        largest = prefix_max[i] + 1
+        if forward[i]:
+            f[i] = largest if f[i] == 1 else f[i] - 1
+        else:
+            f[i] = 1 if f[i] == largest else f[i] + 1
+
+        # the values after i did not change, but the prefix maxima might have
+        for j in range(i + 1, m):
+            prefix_max[j] = max(prefix_max[j - 1], f[j - 1])
+
+
+if __name__ == "__main__":
+    print(enum_set_partitions(5, 5))
+    print("----")
+    print(enum_bell_numbers(15))
+    print("----")
+    print(set_partition_to_rgf([{1, 3}, {2, 5}, {4}], 5))
+    print("----")
+    print(rgf_to_set_partition([1, 2, 1, 3, 2]))
+    print("----")
+    print(rgf_lex_successor([1, 2, 1, 3, 2]))
+    print("----")
+    print(rgf_lex_rank([1, 2, 1, 3, 2]))
+    print("----")
+    print(rgf_lex_unrank(5, 22))
+    print("----")
+    print(list(generate_rgf_lex(4)))
+    print("----")
+    print(list(generate_rgf_gray(4)))
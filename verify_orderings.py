@@ -0,0 +1,412 @@
+import math
+import random
+import sys
+import time
+from collections import Counter
+from typing import Any, Callable, Iterable
+
+from compositions import (composition_lex_rank, composition_lex_successor, composition_lex_unrank,
+                          enum_compositions, generate_compositions)
+from integer_partitions import enum_partitions, partition_lex_rank, partition_lex_successor, partition_lex_unrank
+from ksubsets import (k_subset_colex_rank, k_subset_colex_successor, k_subset_colex_unrank, k_subset_lex_rank,
+                      k_subset_lex_successor, k_subset_lex_unrank, k_subset_rev_door_rank, k_subset_rev_door_successor,
+                      k_subset_rev_door_unrank)
+from multisets import (generate_k_multisubsets, generate_multiset_permutations, k_multisubset_lex_rank,
+                       k_multisubset_lex_successor, k_multisubset_lex_unrank, multinomial, multiset_perm_lex_rank,
+                       multiset_perm_lex_successor, multiset_perm_lex_unrank)
+from permutations import (generate_heaps_algorithm, perm_lex_rank, perm_lex_successor, perm_lex_unrank,
+                          trotten_johnson_successor, trotter_johnson_rank, trotter_johnson_unrank)
+from set_partitions import (enum_bell_numbers, enum_set_partitions, generate_rgf_gray, generate_rgf_lex, rgf_lex_rank,
+                            rgf_lex_successor, rgf_lex_unrank)
+from subsets import gray_code_rank, gray_code_successor, gray_code_unrank, subset_lex_rank, subset_lex_unrank
+
+__author__ = "Bram Devlaminck"
+
+# For every ordering we check that:
+#  - rank(unrank(r)) == r
+#  - successor(unrank(r)) == unrank(r + 1) (and None after the last object, or the first object for cyclic orders)
+#  - the number of distinct objects equals the closed form count
+# Small parameters are checked for every rank, for large parameters we only check randomly sampled ranks.
+
+
+def _key(obj: Any) -> tuple:
+    """Hashable version of an object, sets are unordered so they are sorted first"""
+    if isinstance(obj, set):
+        return tuple(sorted(obj))
+    return tuple(obj)
+
+
+def check_ordering(
+        count: int,
+        rank: Callable[[Any], int],
+        unrank: Callable[[int], Any],
+        successor: Callable[[Any], Any] | None = None,
+        cyclic: bool = False,
+        samples: int | None = None,
+        rng: random.Random | None = None
+) -> list[str]:
+    """
+    Check rank, unrank and successor of an ordering containing count objects
+
+    If samples is None (or larger than count) every rank is checked, otherwise only the given number of random ranks.
+    Return a list describing the failures, this list is empty if everything is correct.
+    """
+    exhaustive = samples is None or count <= samples
+    if exhaustive:
+        ranks = range(count)
+    else:
+        rng = rng or random.Random(0)
+        # always check the first and last rank, those contain most of the edge cases
+        ranks = sorted({0, count - 1} | {rng.randrange(count) for _ in range(samples)})
+
+    failures = []
+    seen = set()
+    for r in ranks:
+        obj = unrank(r)
+        seen.add(_key(obj))
+        if (obj_rank := rank(obj)) != r:
+            failures.append(f"rank(unrank({r})) = {obj_rank}")
+
+        if successor is not None:
+            if r + 1 < count:
+                expected = unrank(r + 1)
+            else:
+                expected = unrank(0) if cyclic else None
+            if (obj_successor := successor(obj)) != expected:
+                failures.append(f"successor({obj}) = {obj_successor}, expected {expected}")
+
+    if exhaustive and len(seen) != count:
+        failures.append(f"unrank gives {len(seen)} distinct objects, expected {count}")
+    return failures
+
+
+def check_generation(
+        objects: Iterable[Any],
+        count: int,
+        expected: list[Any] | None = None,
+        ordered: bool = True
+) -> list[str]:
+    """
+    Check that a generator produces count distinct objects
+
+    If expected is given, the generated objects must be exactly these objects in this order,
+    or in any order if ordered is False.
+    """
+    generated = list(objects)
+    failures = []
+    if len(generated) != count:
+        failures.append(f"generated {len(generated)} objects, expected {count}")
+    if len({_key(obj) for obj in generated}) != len(generated):
+        failures.append("generated objects are not distinct")
+    if expected is not None:
+        if ordered and generated != expected:
+            failures.append("generated objects differ from the expected order")
+        elif not ordered and sorted(map(_key, generated)) != sorted(map(_key, expected)):
+            failures.append("generated objects differ from the expected objects")
+    return failures
+
+
+def successor_chain(first: Any, successor: Callable[[Any], Any]) -> list[Any]:
+    """All the objects starting from first, by applying successor until it returns None"""
+    result = []
+    obj = first
+    while obj is not None:
+        result.append(obj)
+        obj = successor(obj)
+    return result
+
+
+def compare_implementations(reference: Callable[[], Any], candidate: Callable[[], Any]) -> tuple[bool, float, float]:
+    """Run both implementations and return whether they give the same result and how long each of them took"""
+    start = time.perf_counter()
+    reference_result = reference()
+    reference_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    candidate_result = candidate()
+    candidate_time = time.perf_counter() - start
+
+    return reference_result == candidate_result, reference_time, candidate_time
+
+
+def _trotter_johnson_unrank_float(n: int, rank: int) -> list[int]:
+    """The previous version of trotter_johnson_unrank using float division, only correct up to n = 18"""
+    permutation = [1]
+    r2 = 0
+    for j in range(2, n + 1):
+        r1 = math.floor(rank * math.factorial(j) / math.factorial(n))
+        k = (r1 - j * r2)
+        end_index = j - k - 2 if r2 % 2 == 0 else k - 1
+        permutation.insert(end_index + 1, j)
+        r2 = r1
+    return permutation
+
+
+def ordering_checks(max_n: int, large_n: int) -> Iterable[tuple[str, int, dict]]:
+    """
+    All the orderings to check as (name, count, keyword arguments for check_ordering)
+
+    Every parameter up to max_n is checked, large_n is used for the parameters that are only sampled
+    """
+    for n in list(range(1, max_n + 1)) + [large_n]:
+        count = math.factorial(n)
+        yield f"perm lex n={n}", count, dict(
+            rank=perm_lex_rank,
+            unrank=lambda r, n=n: perm_lex_unrank(n, r),
+            successor=perm_lex_successor
+        )
+        yield f"trotter johnson n={n}", count, dict(
+            rank=trotter_johnson_rank,
+            unrank=lambda r, n=n: trotter_johnson_unrank(n, r),
+            successor=trotten_johnson_successor
+        )
+
+    for n in list(range(1, max_n + 1)) + [large_n]:
+        count = 2 ** n
+        yield f"subset lex n={n}", count, dict(
+            rank=lambda s, n=n: subset_lex_rank(n, s),
+            unrank=lambda r, n=n: subset_lex_unrank(n, r)
+        )
+        yield f"subset gray code n={n}", count, dict(
+            rank=lambda s, n=n: gray_code_rank(n, s),
+            unrank=lambda r, n=n: gray_code_unrank(n, r),
+            successor=lambda s, n=n: gray_code_successor(n, s)
+        )
+
+    k_subset_params = [(n, k) for n in range(max_n + 1) for k in range(n + 1)] + [(2 * large_n, large_n // 2)]
+    for n, k in k_subset_params:
+        count = math.comb(n, k)
+        yield f"k-subset lex n={n} k={k}", count, dict(
+            rank=lambda s, n=n: k_subset_lex_rank(s, n),
+            unrank=lambda r, n=n, k=k: k_subset_lex_unrank(r, k, n),
+            successor=lambda s, n=n: k_subset_lex_successor(s, n)
+        )
+        yield f"k-subset colex n={n} k={k}", count, dict(
+            rank=k_subset_colex_rank,
+            unrank=lambda r, n=n, k=k: k_subset_colex_unrank(r, k, n),
+            successor=lambda s, n=n: k_subset_colex_successor(s, n)
+        )
+        yield f"k-subset revolving door n={n} k={k}", count, dict(
+            rank=k_subset_rev_door_rank,
+            unrank=lambda r, n=n, k=k: k_subset_rev_door_unrank(r, k, n),
+            successor=lambda s, n=n: k_subset_rev_door_successor(s, n),
+            cyclic=True
+        )
+        if n > 0:
+            yield f"k-multisubset lex n={n} k={k}", math.comb(n + k - 1, k), dict(
+                rank=lambda s, n=n: k_multisubset_lex_rank(s, n),
+                unrank=lambda r, n=n, k=k: k_multisubset_lex_unrank(r, k, n),
+                successor=lambda s, n=n: k_multisubset_lex_successor(s, n)
+            )
+
+    multisets = [[1, 1, 2], [1, 1, 2, 2, 3], [1, 2, 2, 3, 3, 3], [1] * 3 + [2] * 3 + [3] * 2]
+    multisets.append([value for value in range(1, large_n // 4 + 1) for _ in range(value)])
+    for multiset in multisets:
+        count = multinomial(tuple(multiset.count(value) for value in set(multiset)))
+        yield f"multiset perm lex {multiset}", count, dict(
+            rank=multiset_perm_lex_rank,
+            unrank=lambda r, multiset=multiset: multiset_perm_lex_unrank(multiset, r),
+            successor=multiset_perm_lex_successor
+        )
+
+    for m in list(range(1, 2 * max_n + 1)) + [4 * large_n]:
+        p = enum_partitions(m, m)
+        for n in range(1, m + 1) if m <= 2 * max_n else [large_n // 2]:
+            yield f"partition lex m={m} n={n}", p[m][n], dict(
+                rank=lambda a, m=m, n=n: partition_lex_rank(m, n, a),
+                unrank=lambda r, m=m, n=n: partition_lex_unrank(m, n, r),
+                successor=lambda a, m=m, n=n: partition_lex_successor(m, n, a)
+            )
+
+    bell = enum_bell_numbers(max(max_n + 2, large_n))
+    for m in list(range(max_n + 3)) + [large_n]:
+        yield f"set partition rgf lex m={m}", bell[m], dict(
+            rank=rgf_lex_rank,
+            unrank=lambda r, m=m: rgf_lex_unrank(m, r),
+            successor=rgf_lex_successor
+        )
+
+    for m in list(range(2 * max_n + 1)) + [2 * large_n]:
+        for n in range(m + 1) if m <= 2 * max_n else [large_n // 2]:
+            yield f"composition lex m={m} n={n}", enum_compositions(m, n), dict(
+                rank=lambda c, m=m: composition_lex_rank(m, c),
+                unrank=lambda r, m=m, n=n: composition_lex_unrank(m, n, r),
+                successor=lambda c, m=m: composition_lex_successor(m, c)
+            )
+
+
+def _check_rgf_gray(m: int, count: int) -> list[str]:
+    """Check the rgf Gray code generation, every function must differ from the previous one in exactly one position"""
+    generated = list(generate_rgf_gray(m))
+    return check_generation(generated, count) + [
+        f"{a} and {b} differ in more than one position"
+        for a, b in zip(generated, generated[1:])
+        if sum(x != y for x, y in zip(a, b)) != 1
+    ]
+
+
+def _check_bell_numbers(bell: list[int]) -> list[str]:
+    """Compare the Bell numbers with the recurrence B(m + 1) = sum over k of comb(m, k) * B(k)"""
+    expected = [1]
+    for m in range(len(bell) - 1):
+        expected.append(sum(math.comb(m, k) * expected[k] for k in range(m + 1)))
+    return [] if bell == expected else [f"bell numbers {bell} differ from the recurrence {expected}"]
+
+
+def _check_stirling_row(m: int) -> list[str]:
+    """Compare S(m, j) with the number of restricted growth functions of length m that have maximum j"""
+    stirling = enum_set_partitions(m, m)
+    number_of_blocks = Counter(max(f, default=0) for f in generate_rgf_lex(m))
+    return [
+        f"S({m}, {j}) = {stirling[m][j]}, but {number_of_blocks[j]} set partitions have {j} blocks"
+        for j in range(m + 1)
+        if stirling[m][j] != number_of_blocks[j]
+    ]
+
+
+def generation_checks(max_n: int) -> Iterable[tuple[str, Callable[[], list[str]]]]:
+    """All the generators to check as (name, function returning the failures)"""
+    for n in range(1, max_n + 1):
+        yield f"heap's algorithm n={n}", lambda n=n: check_generation(generate_heaps_algorithm(n), math.factorial(n))
+
+    for multiset in [[1, 1, 2], [1, 1, 2, 2, 3], [1, 2, 2, 3, 3, 3], [1] * 3 + [2] * 3 + [3] * 2]:
+        count = multinomial(tuple(multiset.count(value) for value in set(multiset)))
+        yield f"multiset perm cool-lex {multiset}", lambda multiset=multiset, count=count: check_generation(
+            generate_multiset_permutations(multiset), count,
+            [multiset_perm_lex_unrank(multiset, r) for r in range(count)], ordered=False
+        )
+
+    for n in range(1, max_n + 1):
+        for k in range(n + 1):
+            count = math.comb(n + k - 1, k)
+            yield f"k-multisubset generation n={n} k={k}", lambda n=n, k=k, count=count: check_generation(
+                generate_k_multisubsets(k, n), count, [k_multisubset_lex_unrank(r, k, n) for r in range(count)]
+            )
+
+    bell = enum_bell_numbers(max_n + 2)
+    yield f"bell numbers up to m={max_n + 2}", lambda: _check_bell_numbers(bell)
+    for m in range(max_n + 3):
+        yield f"stirling row m={m}", lambda m=m: _check_stirling_row(m)
+        yield f"set partition rgf lex generation m={m}", lambda m=m: check_generation(
+            generate_rgf_lex(m), bell[m], [rgf_lex_unrank(m, r) for r in range(bell[m])]
+        )
+        yield f"set partition rgf gray code m={m}", lambda m=m: _check_rgf_gray(m, bell[m])
+
+    for m in range(2 * max_n + 1):
+        for n in range(m + 1):
+            count = enum_compositions(m, n)
+            yield f"composition generation m={m} n={n}", lambda m=m, n=n, count=count: check_generation(
+                generate_compositions(m, n), count, [composition_lex_unrank(m, n, r) for r in range(count)]
+            )
+
+
+def comparisons(max_n: int) -> Iterable[tuple[str, Callable[[], Any], Callable[[], Any], bool]]:
+    """
+    Reference and faster (or more general) implementations as (name, reference, candidate, expected to be equal)
+
+    The implementations are only expected to differ when the reference is known to be wrong
+    """
+    n = max_n + 1
+    ranks = range(0, math.factorial(n), max(1, math.factorial(n) // 1000))
+    yield (
+        f"trotter johnson unrank float vs integer n={n}",
+        lambda: [_trotter_johnson_unrank_float(n, r) for r in ranks],
+        lambda: [trotter_johnson_unrank(n, r) for r in ranks],
+        True
+    )
+
+    # float division loses precision from n = 19 on, so the old version must differ here while the new one is correct
+    large_ranks = range(1, math.factorial(20), math.factorial(20) // 1000)
+    yield (
+        "trotter johnson unrank float vs integer n=20",
+        lambda: [_trotter_johnson_unrank_float(20, r) for r in large_ranks],
+        lambda: [trotter_johnson_unrank(20, r) for r in large_ranks],
+        False
+    )
+    yield (
+        "trotter johnson rank(unrank(r)) == r n=20",
+        lambda: list(large_ranks),
+        lambda: [trotter_johnson_rank(trotter_johnson_unrank(20, r)) for r in large_ranks],
+        True
+    )
+
+    yield (
+        f"perm lex successor vs multiset perm lex successor n={n}",
+        lambda: successor_chain(list(range(1, n + 1)), perm_lex_successor),
+        lambda: successor_chain(list(range(1, n + 1)), multiset_perm_lex_successor),
+        True
+    )
+
+    multiset = [1, 1, 1, 2, 2, 2, 3, 3]
+    yield (
+        f"deduplicated perm lex vs multiset perm cool-lex {multiset}",
+        lambda: sorted({
+            tuple(multiset[i - 1] for i in permutation)
+            for permutation in successor_chain(list(range(1, len(multiset) + 1)), perm_lex_successor)
+        }),
+        lambda: sorted(tuple(permutation) for permutation in generate_multiset_permutations(multiset)),
+        True
+    )
+    yield (
+        f"multiset perm lex successor vs unrank {multiset}",
+        lambda: successor_chain(sorted(multiset), multiset_perm_lex_successor),
+        lambda: [
+            multiset_perm_lex_unrank(multiset, r)
+            for r in range(multinomial(tuple(multiset.count(value) for value in set(multiset))))
+        ],
+        True
+    )
+
+    m = max_n + 4
+    yield (
+        f"rgf lex successor vs generate_rgf_lex m={m}",
+        lambda: successor_chain([1 for _ in range(m)], rgf_lex_successor),
+        lambda: list(generate_rgf_lex(m)),
+        True
+    )
+
+    m, n = 4 * max_n, max_n
+    yield (
+        f"composition lex successor vs generate_compositions m={m} n={n}",
+        lambda: successor_chain(composition_lex_unrank(m, n, 0), lambda c: composition_lex_successor(m, c)),
+        lambda: list(generate_compositions(m, n)),
+        True
+    )
+    yield (
+        f"k-multisubset lex successor vs generate_k_multisubsets k={n} n={n}",
+        lambda: successor_chain([1 for _ in range(n)], lambda s: k_multisubset_lex_successor(s, n)),
+        lambda: list(generate_k_multisubsets(n, n)),
+        True
+    )
+
+
+def run_all(max_n: int = 6, large_n: int = 40, samples: int = 50, seed: int = 0) -> bool:
+    """Run all the checks and print a report, return True if everything is correct"""
+    rng = random.Random(seed)
+    all_correct = True
+
+    for name, count, kwargs in ordering_checks(max_n, large_n):
+        failures = check_ordering(count, samples=samples, rng=rng, **kwargs)
+        if failures:
+            all_correct = False
+            print(f"FAIL {name}: {failures[:3]}")
+
+    for name, check in generation_checks(max_n):
+        if failures := check():
+            all_correct = False
+            print(f"FAIL {name}: {failures[:3]}")
+
+    for name, reference, candidate, expected_same in comparisons(max_n):
+        same, reference_time, candidate_time = compare_implementations(reference, candidate)
+        correct = same == expected_same
+        all_correct &= correct
+        result = "same" if same else "different"
+        print(f"{'OK  ' if correct else 'FAIL'} {name} ({result}): "
+              f"reference {reference_time:.4f}s, candidate {candidate_time:.4f}s")
+
+    print("all checks passed" if all_correct else "some checks failed")
+    return all_correct
+
+
+if __name__ == "__main__":
+    sys.exit(0 if run_all() else 1)